@@ -0,0 +1,248 @@
+"""Pontuação em lote a partir de Parquet, Arrow IPC ou CSV.
+
+Os arquivos são lidos em fluxo, lote a lote (``RecordBatch``), e apenas as
+colunas em ``feature_names_in_`` do modelo são lidas (projeção de colunas). As
+colunas que faltam (constantes do dataset e ``MonthlyRate``) são montadas
+direto em arrays Arrow, e o lote já na ordem do treinamento é convertido em
+DataFrame com ``split_blocks=True``: colunas numéricas sem nulos chegam ao
+modelo como views dos buffers Arrow, sem materializar linhas nem copiar dados.
+
+Uso pela linha de comando::
+
+    python batch_scoring.py funcionarios.parquet -o scores.parquet
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pyarrow as pa
+
+import prediction
+from imputation import DIMENSOES
+
+BATCH_SIZE = 64 * 1024
+
+# Extensão do arquivo -> formato de leitura
+FORMATOS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+    ".arrows": "ipc_stream",
+    ".csv": "csv",
+}
+
+ID_COLUMN = "EmployeeNumber"
+# Posição (base 0) da linha no arquivo de entrada, contada ao longo dos lotes
+ROW_COLUMN = "RowOffset"
+
+
+def detect_format(nome):
+    """Identifica o formato pela extensão do nome do arquivo."""
+    extensao = os.path.splitext(nome)[1].lower()
+    if extensao not in FORMATOS:
+        raise ValueError(
+            f"Formato '{extensao}' não suportado. Use: {', '.join(sorted(FORMATOS))}"
+        )
+    return FORMATOS[extensao]
+
+
+def _open_source(source):
+    """Caminhos são mapeados em memória; objetos ``BytesIO`` (ex.: upload do
+    Streamlit) são embrulhados sem cópia em um buffer Arrow."""
+    if isinstance(source, (str, os.PathLike)):
+        return pa.memory_map(os.fspath(source), "r")
+    if hasattr(source, "getbuffer"):
+        # getbuffer() expõe a memória do BytesIO (getvalue() criaria uma cópia)
+        return pa.BufferReader(pa.py_buffer(source.getbuffer()))
+    return source
+
+
+# ==================== LEITURA EM FLUXO ====================
+def iter_record_batches(source, colunas, formato, batch_size=BATCH_SIZE):
+    """Gera ``RecordBatch``es de até ``batch_size`` linhas contendo apenas as
+    ``colunas`` presentes no arquivo."""
+    arquivo = _open_source(source)
+    try:
+        yield from _read_batches(arquivo, colunas, formato, batch_size)
+    finally:
+        # Fecha o mapeamento/buffer aberto aqui; objetos do chamador ficam abertos
+        if arquivo is not source:
+            arquivo.close()
+
+
+def _read_batches(arquivo, colunas, formato, batch_size):
+    if formato == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(arquivo)
+        projecao = [c for c in colunas if c in parquet.schema_arrow.names]
+        yield from parquet.iter_batches(batch_size=batch_size, columns=projecao)
+
+    elif formato in ("ipc", "ipc_stream"):
+        if formato == "ipc":
+            leitor = pa.ipc.open_file(arquivo)
+            lotes = (leitor.get_batch(i) for i in range(leitor.num_record_batches))
+        else:
+            leitor = pa.ipc.open_stream(arquivo)
+            lotes = iter(leitor)
+        projecao = [c for c in colunas if c in leitor.schema.names]
+        # select() só reordena referências aos buffers, sem copiar dados
+        for lote in lotes:
+            yield lote.select(projecao)
+
+    elif formato == "csv":
+        import pyarrow.csv as pacsv
+
+        leitor = pacsv.open_csv(
+            arquivo,
+            # O leitor de CSV divide o arquivo em blocos de bytes; o tamanho do
+            # bloco só aproxima o número de linhas, e o fatiamento abaixo garante
+            # o limite de batch_size linhas por lote
+            read_options=pacsv.ReadOptions(block_size=batch_size * 256),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=list(colunas), include_missing_columns=True
+            ),
+        )
+        # Colunas ausentes no CSV voltam como tipo null e são tratadas como faltantes
+        projecao = [
+            c for c in colunas if not pa.types.is_null(leitor.schema.field(c).type)
+        ]
+        for lote in leitor:
+            lote = lote.select(projecao)
+            # slice() é uma view sobre o mesmo lote, sem cópia
+            for inicio in range(0, lote.num_rows, batch_size):
+                yield lote.slice(inicio, batch_size)
+
+    else:
+        raise ValueError(f"Formato '{formato}' não suportado.")
+
+
+# ==================== MONTAGEM DO LOTE ====================
+def complete_batch(lote, colunas_esperadas, imputer):
+    """Completa as colunas faltantes e devolve o lote na ordem do treinamento."""
+    n = lote.num_rows
+    arrays = []
+    for coluna in colunas_esperadas:
+        indice = lote.schema.get_field_index(coluna)
+        if indice >= 0:
+            arrays.append(lote.column(indice))
+        elif coluna in prediction.CONSTANT_COLUMNS:
+            valor = prediction.CONSTANT_COLUMNS[coluna]
+            arrays.append(pa.array(np.full(n, valor, dtype=type(valor))))
+        elif coluna == "MonthlyRate":
+            # Estimado para o lote inteiro de uma vez, sem laço em Python
+            chaves = {d: lote.column(d) for d in DIMENSOES if d in lote.schema.names}
+            arrays.append(pa.array(imputer.resolve(chaves, n)))
+        else:
+            raise KeyError(coluna)
+    return pa.RecordBatch.from_arrays(arrays, names=list(colunas_esperadas))
+
+
+# ==================== PONTUAÇÃO ====================
+def score_batches(source, modelo, imputer, formato, batch_size=BATCH_SIZE):
+    """Pontua o arquivo em fluxo, devolvendo um ``RecordBatch`` de saída por lote.
+
+    Cada lote de saída traz a posição da linha na entrada (``RowOffset``),
+    ``EmployeeNumber`` (quando existe na entrada), a classe prevista
+    (``Label``) e a probabilidade de rotatividade (``Score``).
+    Levanta ``KeyError`` se faltar no arquivo uma coluna que não pode ser inferida.
+    """
+    colunas = list(modelo.feature_names_in_)
+    deslocamento = 0
+    for lote in iter_record_batches(source, colunas, formato, batch_size):
+        entrada = complete_batch(lote, colunas, imputer)
+        df_input = entrada.to_pandas(split_blocks=True)
+        probas = modelo.predict_proba(df_input)
+        # predict() do GaussianNB é o argmax de predict_proba: evita uma 2ª passada
+        label = modelo.classes_.take(probas.argmax(axis=1))
+        proba = probas[:, 1]
+
+        saida = {
+            ROW_COLUMN: pa.array(
+                np.arange(deslocamento, deslocamento + lote.num_rows, dtype="int64")
+            )
+        }
+        deslocamento += lote.num_rows
+        if ID_COLUMN in lote.schema.names:
+            saida[ID_COLUMN] = lote.column(ID_COLUMN)
+        saida["Label"] = pa.array(label)
+        saida["Score"] = pa.array(proba)
+        yield pa.RecordBatch.from_pydict(saida)
+
+
+def score_table(source, modelo, imputer, formato, **kwargs):
+    """Pontua o arquivo inteiro e junta os lotes de saída em uma ``pa.Table``."""
+    lotes = list(score_batches(source, modelo, imputer, formato, **kwargs))
+    if not lotes:
+        return pa.table(
+            {
+                ROW_COLUMN: pa.array([], pa.int64()),
+                "Label": pa.array([], pa.int64()),
+                "Score": pa.array([], pa.float64()),
+            }
+        )
+    return pa.Table.from_batches(lotes)
+
+
+def table_to_parquet_bytes(tabela):
+    """Serializa a tabela de predições em Parquet, em memória."""
+    import pyarrow.parquet as pq
+
+    buffer = pa.BufferOutputStream()
+    pq.write_table(tabela, buffer)
+    return buffer.getvalue().to_pybytes()
+
+
+def score_to_parquet(source, destino, modelo, imputer, formato, **kwargs):
+    """Grava as predições em Parquet à medida que os lotes são pontuados."""
+    import pyarrow.parquet as pq
+
+    escritor = None
+    total = 0
+    try:
+        lotes = score_batches(source, modelo, imputer, formato, **kwargs)
+        for lote in lotes:
+            if escritor is None:
+                escritor = pq.ParquetWriter(destino, lote.schema)
+            escritor.write_batch(lote)
+            total += lote.num_rows
+    finally:
+        if escritor is not None:
+            escritor.close()
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "entrada", help="arquivo .parquet, .arrow/.feather, .arrows ou .csv"
+    )
+    parser.add_argument(
+        "-o", "--output", required=True, help="arquivo Parquet de saída"
+    )
+    parser.add_argument("--format", choices=sorted(set(FORMATOS.values())))
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help="máximo de linhas por lote (em todos os formatos)",
+    )
+    args = parser.parse_args(argv)
+
+    formato = args.format or detect_format(args.entrada)
+    total = score_to_parquet(
+        args.entrada,
+        args.output,
+        prediction.load_model(),
+        prediction.load_monthly_rate_imputer(),
+        formato,
+        batch_size=args.batch_size,
+    )
+    print(f"{total} funcionários pontuados -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Tabelas de imputação de MonthlyRate derivadas do dataset.
+
+``MonthlyRate`` não é pedido no formulário; ele é estimado pela média do
+grupo mais específico conhecido, nesta ordem de granularidade:
+
+    cargo x nível  ->  cargo  ->  departamento  ->  média global
+
+A etapa de construção (``python imputation.py``) agrupa
+``HR-Employee-Attrition.csv`` nesses níveis e grava ``imputacao_monthly_rate.json``.
+Na inferência, ``MonthlyRateImputer`` pré-calcula um índice hierárquico denso
+(cargo x nível x departamento, com uma posição extra para valores
+desconhecidos em cada dimensão) em que a hierarquia já está resolvida. Estimar
+um lote inteiro é então uma codificação por coluna e uma única indexação numpy.
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+DATA_PATH = "HR-Employee-Attrition.csv"
+TABLES_PATH = "imputacao_monthly_rate.json"
+TARGET = "MonthlyRate"
+
+# Níveis de granularidade, do mais específico ao mais geral
+NIVEIS = [["JobRole", "JobLevel"], ["JobRole"], ["Department"]]
+# Dimensões do índice denso (união das chaves dos níveis)
+DIMENSOES = ["JobRole", "JobLevel", "Department"]
+# Grupos com menos linhas que isso caem para o nível seguinte
+MIN_LINHAS = 5
+
+
+# ==================== CONSTRUÇÃO ====================
+def build_tables(data_path=DATA_PATH, min_linhas=MIN_LINHAS):
+    """Agrupa o dataset em cada nível e devolve as tabelas serializáveis."""
+    import pandas as pd
+
+    dados = pd.read_csv(data_path, usecols=DIMENSOES + [TARGET])
+    niveis = []
+    for chaves in NIVEIS:
+        grupos = dados.groupby(chaves)[TARGET].agg(["mean", "size"]).reset_index()
+        grupos = grupos[grupos["size"] >= min_linhas]
+        # Linhas [chaves..., média, contagem] com tipos nativos (serializáveis)
+        valores = json.loads(grupos.to_json(orient="values", double_precision=15))
+        niveis.append({"chaves": chaves, "valores": valores})
+    return {
+        "alvo": TARGET,
+        "niveis": niveis,
+        "global": float(dados[TARGET].mean()),
+    }
+
+
+def save_tables(tabelas, path=TABLES_PATH):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(tabelas, f, ensure_ascii=False, indent=2)
+
+
+# ==================== INFERÊNCIA ====================
+class MonthlyRateImputer:
+    """Resolve MonthlyRate para lotes inteiros com um índice hierárquico denso."""
+
+    def __init__(self, tabelas):
+        import pandas as pd
+
+        self.valor_global = float(tabelas["global"])
+
+        # Valores conhecidos de cada dimensão, na ordem em que aparecem nas tabelas
+        self.categorias = {d: [] for d in DIMENSOES}
+        for nivel in tabelas["niveis"]:
+            for linha in nivel["valores"]:
+                for chave, valor in zip(nivel["chaves"], linha):
+                    if valor not in self.categorias[chave]:
+                        self.categorias[chave].append(valor)
+
+        # A última posição de cada eixo representa "desconhecido"
+        formato = tuple(len(self.categorias[d]) + 1 for d in DIMENSOES)
+        indice = np.full(formato, np.nan)
+
+        # Preenche do nível mais geral ao mais específico: cada nível sobrescreve
+        # o anterior só onde tem valor, o que resolve a hierarquia de antemão.
+        for nivel in reversed(tabelas["niveis"]):
+            for linha in nivel["valores"]:
+                posicao = [slice(None)] * len(DIMENSOES)
+                for chave, valor in zip(nivel["chaves"], linha):
+                    posicao[DIMENSOES.index(chave)] = self.categorias[chave].index(
+                        valor
+                    )
+                indice[tuple(posicao)] = linha[len(nivel["chaves"])]
+        indice[np.isnan(indice)] = self.valor_global
+        self.indice = indice
+        self.eixos = {d: pd.Index(self.categorias[d]) for d in DIMENSOES}
+
+    @classmethod
+    def from_json(cls, path=TABLES_PATH):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _codes(self, dimensao, valores, n):
+        """Codifica uma coluna nas posições do eixo (desconhecido = último)."""
+        desconhecido = len(self.categorias[dimensao])
+        if valores is None:
+            return np.full(n, desconhecido, dtype="int64")
+        codigos = self.eixos[dimensao].get_indexer(np.asarray(valores))
+        return np.where(codigos < 0, desconhecido, codigos)
+
+    def resolve(self, colunas, n):
+        """Estima MonthlyRate para ``n`` linhas.
+
+        ``colunas`` mapeia o nome de cada dimensão para uma coluna (lista, array
+        numpy, Series ou array Arrow); dimensões ausentes contam como desconhecidas.
+        """
+        codigos = tuple(self._codes(d, colunas.get(d), n) for d in DIMENSOES)
+        return self.indice[codigos]
+
+    def resolve_one(self, features):
+        """Estima MonthlyRate para um único dicionário de features."""
+        return float(self.resolve({d: [features.get(d)] for d in DIMENSOES}, 1)[0])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Gera as tabelas de imputação de MonthlyRate a partir do dataset."
+    )
+    parser.add_argument("--data", default=DATA_PATH)
+    parser.add_argument("-o", "--output", default=TABLES_PATH)
+    parser.add_argument("--min-rows", type=int, default=MIN_LINHAS)
+    args = parser.parse_args(argv)
+
+    tabelas = build_tables(args.data, args.min_rows)
+    save_tables(tabelas, args.output)
+    resumo = ", ".join(
+        f"{' x '.join(n['chaves'])}: {len(n['valores'])}" for n in tabelas["niveis"]
+    )
+    print(
+        f"Tabelas gravadas em {args.output} "
+        f"({resumo}; global: {tabelas['global']:.1f})"
+    )
+
+
+if __name__ == "__main__":
+    main()
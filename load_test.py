@@ -0,0 +1,477 @@
+"""Teste de carga do caminho de predição do app.
+
+Simula vários usuários de RH simultâneos reproduzindo perfis realistas (os
+cenários de ``cenarios.csv`` e linhas amostradas de ``HR-Employee-Attrition.csv``)
+em dois alvos:
+
+- ``inprocess``: chama o mesmo código de predição do app, em threads dentro de
+  um único processo (como as sessões do Streamlit em uma instância do Render);
+- ``http``: sobe uma interface HTTP local (``POST /predict``) com um ou mais
+  processos servidores e dispara requisições contra ela.
+
+Para cada nível de concorrência (ou taxa de chegada) são reportados vazão,
+latências p50/p95/p99, CPU e memória por worker e o ponto de saturação.
+
+Exemplos::
+
+    python load_test.py --mode inprocess --concurrency 1,2,4,8,16
+    python load_test.py --mode http --http-workers 2 --rate 20,40,80
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import queue
+import random
+import resource
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+import prediction
+import scenario_catalog
+
+DATA_PATH = "HR-Employee-Attrition.csv"
+
+
+# ==================== PERFIS ====================
+def load_profiles(n_amostras, seed, data_path=DATA_PATH):
+    """Monta a lista de perfis (dicionários de features) usada na carga."""
+    cenarios = scenario_catalog.load_catalog().to_dict("records")
+    perfis = [prediction.features_from_profile(p) for p in cenarios]
+    if n_amostras > 0:
+        dados = pd.read_csv(data_path).drop(columns=["Attrition"])
+        amostra = dados.sample(
+            n=min(n_amostras, len(dados)), random_state=seed, replace=False
+        )
+        # to_json/loads converte os tipos numpy em tipos nativos (serializáveis)
+        perfis.extend(json.loads(amostra.to_json(orient="records")))
+    return perfis
+
+
+# ==================== ESTATÍSTICAS DE PROCESSO ====================
+def process_stats():
+    """CPU acumulada (s) e pico de memória residente (MB) do processo atual."""
+    uso = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss é reportado em KB no Linux e em bytes no macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "pid": os.getpid(),
+        "cpu_s": uso.ru_utime + uso.ru_stime,
+        "max_rss_mb": uso.ru_maxrss / divisor,
+    }
+
+
+# ==================== ALVO EM PROCESSO ====================
+class InProcessTarget:
+    """Executa a predição diretamente, reaproveitando modelo e médias carregados."""
+
+    name = "inprocess"
+
+    def __init__(self):
+        self.modelo = prediction.load_model()
+        self.imputer = prediction.load_monthly_rate_imputer()
+
+    def client(self):
+        return self
+
+    def __call__(self, features):
+        return prediction.predict_features(self.modelo, features, self.imputer)
+
+    def snapshot(self):
+        return [process_stats()]
+
+    def close(self):
+        pass
+
+
+# ==================== ALVO HTTP ====================
+class _PredictHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, status, payload):
+        corpo = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._reply(200, process_stats())
+        else:
+            self._reply(404, {"erro": "rota não encontrada"})
+
+    def do_POST(self):
+        if self.path != "/predict":
+            self._reply(404, {"erro": "rota não encontrada"})
+            return
+        tamanho = int(self.headers.get("Content-Length", 0))
+        try:
+            features = json.loads(self.rfile.read(tamanho))
+            pred_num, proba = prediction.predict_features(
+                self.server.modelo, features, self.server.imputer
+            )
+        except Exception as e:
+            self._reply(400, {"erro": str(e)})
+            return
+        self._reply(200, {"prediction": int(pred_num), "probability": float(proba)})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(porta):
+    """Processo servidor: expõe ``POST /predict`` e ``GET /stats`` em localhost."""
+    # Carrega antes de abrir a porta: o servidor só é visto como pronto já aquecido
+    modelo = prediction.load_model()
+    imputer = prediction.load_monthly_rate_imputer()
+    servidor = ThreadingHTTPServer(("127.0.0.1", porta), _PredictHandler)
+    servidor.daemon_threads = True
+    servidor.modelo = modelo
+    servidor.imputer = imputer
+    servidor.serve_forever()
+
+
+class _HttpClient:
+    """Cliente com conexão persistente; um por thread de carga."""
+
+    def __init__(self, portas):
+        self.conexoes = [
+            http.client.HTTPConnection("127.0.0.1", p, timeout=30) for p in portas
+        ]
+        self.proxima = 0
+
+    def __call__(self, features):
+        conexao = self.conexoes[self.proxima]
+        self.proxima = (self.proxima + 1) % len(self.conexoes)
+        try:
+            conexao.request(
+                "POST",
+                "/predict",
+                body=json.dumps(features),
+                headers={"Content-Type": "application/json"},
+            )
+            resposta = conexao.getresponse()
+            corpo = json.loads(resposta.read())
+        except Exception:
+            # Após timeout ou resposta interrompida a conexão fica presa no estado
+            # "request-sent"; fechá-la faz a próxima chamada reconectar
+            conexao.close()
+            raise
+        if resposta.status != 200:
+            raise RuntimeError(corpo.get("erro", resposta.status))
+        return corpo["prediction"], corpo["probability"]
+
+
+class HttpTarget:
+    """Sobe ``n_workers`` processos servidores em portas consecutivas."""
+
+    name = "http"
+
+    def __init__(self, n_workers, porta_inicial, timeout_inicio=120):
+        self.portas = [porta_inicial + i for i in range(n_workers)]
+        self.processos = [
+            multiprocessing.Process(target=serve, args=(p,), daemon=True)
+            for p in self.portas
+        ]
+        for processo in self.processos:
+            processo.start()
+        limite = time.monotonic() + timeout_inicio
+        while True:
+            try:
+                self.snapshot()
+                break
+            except OSError:
+                if time.monotonic() > limite:
+                    self.close()
+                    raise RuntimeError("Servidores HTTP não responderam a tempo.")
+                time.sleep(0.2)
+
+    def client(self):
+        return _HttpClient(self.portas)
+
+    def snapshot(self):
+        stats = []
+        for porta in self.portas:
+            conexao = http.client.HTTPConnection("127.0.0.1", porta, timeout=5)
+            try:
+                conexao.request("GET", "/stats")
+                stats.append(json.loads(conexao.getresponse().read()))
+            finally:
+                conexao.close()
+        return stats
+
+    def close(self):
+        for processo in self.processos:
+            processo.terminate()
+            processo.join()
+
+
+# ==================== GERAÇÃO DE CARGA ====================
+def _closed_loop(target, perfis, concorrencia, duracao, seed):
+    """Cada usuário virtual envia a próxima requisição assim que a anterior termina."""
+    latencias, erros, cpu_threads = [], [0], []
+    trava = threading.Lock()
+    fim = time.perf_counter() + duracao
+
+    def usuario(indice):
+        rng = random.Random(seed + indice)
+        cliente = target.client()
+        locais, falhas = [], 0
+        cpu_inicio = time.thread_time()
+        while time.perf_counter() < fim:
+            features = rng.choice(perfis)
+            t0 = time.perf_counter()
+            try:
+                cliente(features)
+                locais.append(time.perf_counter() - t0)
+            except Exception:
+                falhas += 1
+        with trava:
+            latencias.extend(locais)
+            erros[0] += falhas
+            cpu_threads.append(time.thread_time() - cpu_inicio)
+
+    threads = [
+        threading.Thread(target=usuario, args=(i,)) for i in range(concorrencia)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencias, erros[0], 0, cpu_threads
+
+
+def _open_loop(target, perfis, concorrencia, duracao, taxa, seed):
+    """Chegadas de Poisson a ``taxa`` req/s atendidas por ``concorrencia`` workers.
+
+    A latência é medida a partir do instante agendado de chegada, portanto inclui
+    o tempo de fila quando os workers não dão conta da taxa.
+    """
+    fila = queue.Queue()
+    latencias, erros, cpu_threads = [], [0], []
+    trava = threading.Lock()
+    inicio = time.perf_counter()
+    fim = inicio + duracao
+
+    def despachante():
+        rng = random.Random(seed)
+        chegada = inicio
+        while True:
+            chegada += rng.expovariate(taxa)
+            if chegada >= fim:
+                break
+            espera = chegada - time.perf_counter()
+            if espera > 0:
+                time.sleep(espera)
+            fila.put((chegada, rng.choice(perfis)))
+
+    def worker():
+        cliente = target.client()
+        locais, falhas = [], 0
+        cpu_inicio = time.thread_time()
+        # O que sobrar na fila ao fim da janela conta como não atendido
+        while time.perf_counter() < fim:
+            try:
+                chegada, features = fila.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            try:
+                cliente(features)
+                locais.append(time.perf_counter() - chegada)
+            except Exception:
+                falhas += 1
+        with trava:
+            latencias.extend(locais)
+            erros[0] += falhas
+            cpu_threads.append(time.thread_time() - cpu_inicio)
+
+    threads = [threading.Thread(target=despachante)] + [
+        threading.Thread(target=worker) for _ in range(concorrencia)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencias, erros[0], fila.qsize(), cpu_threads
+
+
+def run_level(target, perfis, concorrencia, duracao, taxa=None, seed=0):
+    """Executa um nível de carga e devolve o dicionário de métricas."""
+    antes = {s["pid"]: s for s in target.snapshot()}
+    t0 = time.perf_counter()
+    if taxa is None:
+        latencias, erros, pendentes, cpu_threads = _closed_loop(
+            target, perfis, concorrencia, duracao, seed
+        )
+    else:
+        latencias, erros, pendentes, cpu_threads = _open_loop(
+            target, perfis, concorrencia, duracao, taxa, seed
+        )
+    decorrido = time.perf_counter() - t0
+    depois = target.snapshot()
+
+    workers = []
+    for s in depois:
+        cpu = s["cpu_s"] - antes.get(s["pid"], s)["cpu_s"]
+        workers.append(
+            {
+                "pid": s["pid"],
+                "cpu_pct": 100 * cpu / decorrido,
+                "max_rss_mb": s["max_rss_mb"],
+            }
+        )
+
+    ms = np.array(latencias) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99]) if len(ms) else (np.nan,) * 3
+    return {
+        "alvo": target.name,
+        "concorrencia": concorrencia,
+        "taxa": taxa,
+        "requisicoes": len(latencias),
+        "erros": erros,
+        "nao_atendidas": pendentes,
+        "vazao_rps": len(latencias) / decorrido,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "cpu_por_thread_s": [round(c, 3) for c in cpu_threads],
+        "workers": workers,
+    }
+
+
+def find_saturation(resultados, slo_p95_ms, ganho_minimo=0.10):
+    """Último nível antes de a vazão parar de crescer ou de o p95 estourar o SLO.
+
+    Retorna ``{"situacao": ..., "nivel": ...}``, com ``situacao`` igual a:
+
+    - ``"saturado"``: ``nivel`` é o último nível dentro da capacidade;
+    - ``"sem_saturacao"``: nenhum nível saturou (é preciso testar níveis maiores);
+    - ``"abaixo_do_minimo"``: o primeiro nível testado já estourou o SLO ou teve
+      erros ou fila; ``nivel`` é esse nível e é preciso testar níveis menores.
+    """
+    anterior = None
+    for r in resultados:
+        estourou = r["p95_ms"] > slo_p95_ms or r["erros"] or r["nao_atendidas"]
+        if anterior is None:
+            if estourou:
+                return {"situacao": "abaixo_do_minimo", "nivel": r}
+        elif estourou or r["vazao_rps"] < anterior["vazao_rps"] * (1 + ganho_minimo):
+            return {"situacao": "saturado", "nivel": anterior}
+        anterior = r
+    return {"situacao": "sem_saturacao", "nivel": None}
+
+
+# ==================== RELATÓRIO ====================
+def print_report(resultados, saturacao, slo_p95_ms):
+    cabecalho = (
+        f"{'alvo':<10}{'conc':>6}{'taxa':>8}{'req':>8}{'erros':>7}{'fila':>6}"
+        f"{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  workers (cpu% / rss MB)"
+    )
+    print(cabecalho)
+    print("-" * len(cabecalho))
+    for r in resultados:
+        workers = ", ".join(
+            f"{w['cpu_pct']:.0f}%/{w['max_rss_mb']:.0f}" for w in r["workers"]
+        )
+        taxa = "-" if r["taxa"] is None else f"{r['taxa']:g}"
+        print(
+            f"{r['alvo']:<10}{r['concorrencia']:>6}{taxa:>8}{r['requisicoes']:>8}"
+            f"{r['erros']:>7}{r['nao_atendidas']:>6}{r['vazao_rps']:>9.1f}"
+            f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}  {workers}"
+        )
+    print()
+    nivel = saturacao["nivel"]
+    if saturacao["situacao"] == "sem_saturacao":
+        print(
+            f"Sem saturação até o último nível (SLO p95 = {slo_p95_ms:g} ms). "
+            "Aumente a concorrência ou a taxa."
+        )
+        return
+
+    taxa = "" if nivel["taxa"] is None else f", taxa {nivel['taxa']:g}"
+    if saturacao["situacao"] == "abaixo_do_minimo":
+        print(
+            f"Saturado já no menor nível testado ({nivel['alvo']}): concorrência "
+            f"{nivel['concorrencia']}{taxa} -> p95 {nivel['p95_ms']:.1f} ms, "
+            f"{nivel['erros']} erros, {nivel['nao_atendidas']} não atendidas "
+            f"(SLO p95 = {slo_p95_ms:g} ms). Teste concorrência ou taxa menores."
+        )
+    else:
+        print(
+            f"Ponto de saturação ({nivel['alvo']}): concorrência "
+            f"{nivel['concorrencia']}{taxa} -> {nivel['vazao_rps']:.1f} req/s, "
+            f"p95 {nivel['p95_ms']:.1f} ms"
+        )
+
+
+def _parse_list(texto, tipo):
+    return [tipo(v) for v in texto.split(",") if v.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["inprocess", "http", "both"], default="both")
+    parser.add_argument(
+        "--concurrency",
+        default="1,2,4,8,16",
+        help="níveis de usuários simultâneos (lista separada por vírgula)",
+    )
+    parser.add_argument(
+        "--rate",
+        default=None,
+        help="taxas de chegada em req/s (carga aberta); sem isso, carga fechada",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="segundos por nível")
+    parser.add_argument("--samples", type=int, default=200, help="linhas do CSV")
+    parser.add_argument("--http-workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--slo-p95-ms", type=float, default=500.0)
+    parser.add_argument("--seed", type=int, default=123)
+    parser.add_argument("--output", help="salva os resultados em JSON")
+    args = parser.parse_args(argv)
+
+    perfis = load_profiles(args.samples, args.seed)
+    concorrencias = _parse_list(args.concurrency, int)
+    taxas = _parse_list(args.rate, float) if args.rate else None
+    modos = ["inprocess", "http"] if args.mode == "both" else [args.mode]
+
+    relatorio = {}
+    for modo in modos:
+        if modo == "inprocess":
+            target = InProcessTarget()
+        else:
+            target = HttpTarget(args.http_workers, args.port)
+        try:
+            # Aquece o caminho de predição antes de medir
+            target.client()(perfis[0])
+            if taxas is None:
+                niveis = [(c, None) for c in concorrencias]
+            else:
+                niveis = [(max(concorrencias), t) for t in taxas]
+            resultados = [
+                run_level(target, perfis, c, args.duration, t, args.seed)
+                for c, t in niveis
+            ]
+        finally:
+            target.close()
+        saturacao = find_saturation(resultados, args.slo_p95_ms)
+        print_report(resultados, saturacao, args.slo_p95_ms)
+        print()
+        relatorio[modo] = {"niveis": resultados, "saturacao": saturacao}
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
-import pandas as pd
 import streamlit as st
-import numpy as np
-import joblib
-import json
-from PIL import Image
+
+import prediction
+import scenario_catalog
+
+# Limite de linhas enviadas à tabela da biblioteca (as de maior risco primeiro)
+MAX_LINHAS_CATALOGO = 2000
 
 # Configuração da página
 st.set_page_config(
@@ -13,6 +14,10 @@ st.set_page_config(
     page_icon="./images/snapchat-circle.png",
 )
 
+# Carga e aquecimento do modelo em segundo plano enquanto o formulário é desenhado
+if prediction.warm_start_enabled():
+    prediction.warm_start()
+
 # Inicialização do session state
 if "form_data" not in st.session_state:
     st.session_state["form_data"] = {}
@@ -21,20 +26,42 @@ if "form_data" not in st.session_state:
 # ==================== FUNÇÕES COM CACHE ====================
 @st.cache_resource
 def load_model():
-    """Carrega o modelo treinado (pipeline PyCaret)."""
-    return joblib.load("modelo_naive_bayes_02_02_2026.pkl")
+    """Carrega o modelo treinado (pipeline PyCaret), já aquecido quando
+    WARM_START está ativo."""
+    if not prediction.warm_start_enabled():
+        return prediction.load_model()
+    return prediction.get_warm_model()
 
 
-@st.cache_data
-def load_monthly_rate_avg():
-    """Carrega o dicionário com a média de MonthlyRate por cargo."""
-    with open("media_monthly_rate_per_job_role.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+@st.cache_resource
+def load_monthly_rate_imputer():
+    """Carrega as tabelas de imputação de MonthlyRate (cargo x nível, cargo,
+    departamento e média global), reaproveitando as montadas no aquecimento."""
+    if not prediction.warm_start_enabled():
+        return prediction.load_monthly_rate_imputer()
+    return prediction.get_warm_imputer()
+
+
+@st.cache_data(persist="disk", show_spinner="Pontuando a biblioteca de cenários...")
+def load_scored_catalog(versao_modelo, versao_catalogo, versao_imputacao):
+    """Pontua a biblioteca de cenários inteira em lote e devolve também as
+    linhas descartadas na validação.
+
+    Os argumentos só compõem a chave do cache: o catálogo é pontuado uma única
+    vez por versão do modelo, do catálogo e das tabelas de imputação.
+    """
+    catalogo, problemas = scenario_catalog.read_catalog()
+    pontuado = scenario_catalog.score_catalog(
+        catalogo, load_model(), load_monthly_rate_imputer()
+    )
+    return pontuado, problemas
 
 
 @st.cache_data
 def load_data(uploaded_file):
     """Carrega dados de um arquivo CSV (funcionalidade futura)."""
+    import pandas as pd
+
     try:
         return pd.read_csv(uploaded_file)
     except Exception as e:
@@ -45,357 +72,135 @@ def load_data(uploaded_file):
 # ==================== FUNÇÃO AUXILIAR ====================
 def build_features_from_session():
     """Coleta todos os valores do session_state e retorna um dicionário de features."""
-    return {
-        "Age": st.session_state.get("age"),
-        "Gender": st.session_state.get("gender"),
-        "MaritalStatus": st.session_state.get("marital_status"),
-        "DistanceFromHome": st.session_state.get("distance_from_home"),
-        "Education": st.session_state.get("education"),
-        "EducationField": st.session_state.get("education_field"),
-        "Department": st.session_state.get("department"),
-        "JobRole": st.session_state.get("job_role"),
-        "JobLevel": st.session_state.get("job_level"),
-        "OverTime": st.session_state.get("overtime"),
-        "BusinessTravel": st.session_state.get("business_travel"),
-        "MonthlyIncome": st.session_state.get("monthly_income"),
-        "DailyRate": st.session_state.get("daily_rate"),
-        "HourlyRate": st.session_state.get("hourly_rate"),
-        "PercentSalaryHike": st.session_state.get("percent_salary_hike"),
-        "StockOptionLevel": st.session_state.get("stock_option_level"),
-        "NumCompaniesWorked": st.session_state.get("num_companies_worked"),
-        "TotalWorkingYears": st.session_state.get("total_working_years"),
-        "YearsAtCompany": st.session_state.get("years_at_company"),
-        "YearsInCurrentRole": st.session_state.get("years_in_current_role"),
-        "YearsSinceLastPromotion": st.session_state.get("years_since_last_promotion"),
-        "YearsWithCurrManager": st.session_state.get("years_with_curr_manager"),
-        "TrainingTimesLastYear": st.session_state.get("training_times_last_year"),
-        "EnvironmentSatisfaction": st.session_state.get("environment_satisfaction"),
-        "JobSatisfaction": st.session_state.get("job_satisfaction"),
-        "RelationshipSatisfaction": st.session_state.get("relationship_satisfaction"),
-        "WorkLifeBalance": st.session_state.get("work_life_balance"),
-        "JobInvolvement": st.session_state.get("job_involvement"),
-        "PerformanceRating": st.session_state.get("performance_rating"),
-    }
-
-
-avatares = {
-    "Claudio": {
-        "age": 52,
-        "gender": "Male",
-        "marital_status": "Married",
-        "distance_from_home": 2,
-        "education": 4,
-        "education_field": "Technical Degree",
-        "department": "Research & Development",
-        "job_role": "Research Director",
-        "job_level": 4,
-        "overtime": "No",
-        "business_travel": "Travel Rarely",
-        "monthly_income": 15000,
-        "daily_rate": 1200,
-        "hourly_rate": 65,
-        "percent_salary_hike": 18,
-        "stock_option_level": 2,
-        "num_companies_worked": 2,
-        "total_working_years": 28,
-        "years_at_company": 15,
-        "years_in_current_role": 8,
-        "years_since_last_promotion": 3,
-        "years_with_curr_manager": 7,
-        "training_times_last_year": 3,
-        "environment_satisfaction": 4,
-        "job_satisfaction": 4,
-        "relationship_satisfaction": 3,
-        "work_life_balance": 4,
-        "job_involvement": 4,
-        "performance_rating": 3,
-    },
-    "Henrique": {
-        "age": 29,
-        "gender": "Male",
-        "marital_status": "Single",
-        "distance_from_home": 15,
-        "education": 3,
-        "education_field": "Life Sciences",
-        "department": "Sales",
-        "job_role": "Sales Executive",
-        "job_level": 2,
-        "overtime": "Yes",
-        "business_travel": "Travel Frequently",
-        "monthly_income": 4500,
-        "daily_rate": 800,
-        "hourly_rate": 35,
-        "percent_salary_hike": 10,
-        "stock_option_level": 0,
-        "num_companies_worked": 4,
-        "total_working_years": 6,
-        "years_at_company": 2,
-        "years_in_current_role": 1,
-        "years_since_last_promotion": 2,
-        "years_with_curr_manager": 1,
-        "training_times_last_year": 5,
-        "environment_satisfaction": 2,
-        "job_satisfaction": 2,
-        "relationship_satisfaction": 3,
-        "work_life_balance": 2,
-        "job_involvement": 2,
-        "performance_rating": 2,
-    },
-    "Leandro": {
-        "age": 41,
-        "gender": "Male",
-        "marital_status": "Divorced",
-        "distance_from_home": 8,
-        "education": 3,
-        "education_field": "Medical",
-        "department": "Research & Development",
-        "job_role": "Laboratory Technician",
-        "job_level": 3,
-        "overtime": "Yes",
-        "business_travel": "Travel Rarely",
-        "monthly_income": 5200,
-        "daily_rate": 650,
-        "hourly_rate": 28,
-        "percent_salary_hike": 12,
-        "stock_option_level": 1,
-        "num_companies_worked": 3,
-        "total_working_years": 18,
-        "years_at_company": 10,
-        "years_in_current_role": 5,
-        "years_since_last_promotion": 4,
-        "years_with_curr_manager": 6,
-        "training_times_last_year": 2,
-        "environment_satisfaction": 3,
-        "job_satisfaction": 3,
-        "relationship_satisfaction": 2,
-        "work_life_balance": 3,
-        "job_involvement": 3,
-        "performance_rating": 3,
-    },
-    "Zelia": {
-        "age": 35,
-        "gender": "Female",
-        "marital_status": "Married",
-        "distance_from_home": 5,
-        "education": 4,
-        "education_field": "Marketing",
-        "department": "Sales",
-        "job_role": "Manager",
-        "job_level": 4,
-        "overtime": "No",
-        "business_travel": "Travel Frequently",
-        "monthly_income": 12000,
-        "daily_rate": 1100,
-        "hourly_rate": 58,
-        "percent_salary_hike": 20,
-        "stock_option_level": 3,
-        "num_companies_worked": 1,
-        "total_working_years": 12,
-        "years_at_company": 10,
-        "years_in_current_role": 5,
-        "years_since_last_promotion": 2,
-        "years_with_curr_manager": 4,
-        "training_times_last_year": 4,
-        "environment_satisfaction": 4,
-        "job_satisfaction": 4,
-        "relationship_satisfaction": 4,
-        "work_life_balance": 3,
-        "job_involvement": 4,
-        "performance_rating": 4,
-    },
-    "Julia": {
-        "age": 26,
-        "gender": "Female",
-        "marital_status": "Single",
-        "distance_from_home": 20,
-        "education": 2,
-        "education_field": "Human Resources",
-        "department": "Human Resources",
-        "job_role": "Human Resources",
-        "job_level": 1,
-        "overtime": "Yes",
-        "business_travel": "Non-Travel",
-        "monthly_income": 2800,
-        "daily_rate": 400,
-        "hourly_rate": 20,
-        "percent_salary_hike": 8,
-        "stock_option_level": 0,
-        "num_companies_worked": 2,
-        "total_working_years": 3,
-        "years_at_company": 1,
-        "years_in_current_role": 1,
-        "years_since_last_promotion": 1,
-        "years_with_curr_manager": 1,
-        "training_times_last_year": 6,
-        "environment_satisfaction": 2,
-        "job_satisfaction": 1,
-        "relationship_satisfaction": 2,
-        "work_life_balance": 1,
-        "job_involvement": 2,
-        "performance_rating": 2,
-    },
-    "Andressa": {
-        "age": 45,
-        "gender": "Female",
-        "marital_status": "Married",
-        "distance_from_home": 3,
-        "education": 5,
-        "education_field": "Medical",
-        "department": "Research & Development",
-        "job_role": "Healthcare Representative",
-        "job_level": 5,
-        "overtime": "No",
-        "business_travel": "Travel Rarely",
-        "monthly_income": 13500,
-        "daily_rate": 1300,
-        "hourly_rate": 70,
-        "percent_salary_hike": 22,
-        "stock_option_level": 3,
-        "num_companies_worked": 1,
-        "total_working_years": 22,
-        "years_at_company": 18,
-        "years_in_current_role": 12,
-        "years_since_last_promotion": 5,
-        "years_with_curr_manager": 10,
-        "training_times_last_year": 2,
-        "environment_satisfaction": 4,
-        "job_satisfaction": 4,
-        "relationship_satisfaction": 4,
-        "work_life_balance": 4,
-        "job_involvement": 4,
-        "performance_rating": 4,
-    },
-    "Laura": {
-        "age": 32,
-        "gender": "Female",
-        "marital_status": "Single",
-        "distance_from_home": 10,
-        "education": 4,
-        "education_field": "Life Sciences",
-        "department": "Research & Development",
-        "job_role": "Research Scientist",
-        "job_level": 3,
-        "overtime": "No",
-        "business_travel": "Travel Frequently",
-        "monthly_income": 6200,
-        "daily_rate": 850,
-        "hourly_rate": 42,
-        "percent_salary_hike": 15,
-        "stock_option_level": 1,
-        "num_companies_worked": 2,
-        "total_working_years": 9,
-        "years_at_company": 5,
-        "years_in_current_role": 3,
-        "years_since_last_promotion": 2,
-        "years_with_curr_manager": 3,
-        "training_times_last_year": 3,
-        "environment_satisfaction": 3,
-        "job_satisfaction": 3,
-        "relationship_satisfaction": 3,
-        "work_life_balance": 3,
-        "job_involvement": 3,
-        "performance_rating": 3,
-    },
-    "Bruno": {
-        "age": 38,
-        "gender": "Male",
-        "marital_status": "Married",
-        "distance_from_home": 25,
-        "education": 3,
-        "education_field": "Technical Degree",
-        "department": "Sales",
-        "job_role": "Sales Representative",
-        "job_level": 2,
-        "overtime": "Yes",
-        "business_travel": "Travel Frequently",
-        "monthly_income": 4100,
-        "daily_rate": 550,
-        "hourly_rate": 25,
-        "percent_salary_hike": 9,
-        "stock_option_level": 0,
-        "num_companies_worked": 5,
-        "total_working_years": 15,
-        "years_at_company": 3,
-        "years_in_current_role": 2,
-        "years_since_last_promotion": 3,
-        "years_with_curr_manager": 2,
-        "training_times_last_year": 4,
-        "environment_satisfaction": 2,
-        "job_satisfaction": 2,
-        "relationship_satisfaction": 2,
-        "work_life_balance": 2,
-        "job_involvement": 2,
-        "performance_rating": 2,
-    },
-    "Gabriela": {
-        "age": 29,
-        "gender": "Female",
-        "marital_status": "Married",
-        "distance_from_home": 6,
-        "education": 4,
-        "education_field": "Marketing",
-        "department": "Sales",
-        "job_role": "Manager",
-        "job_level": 4,
-        "overtime": "No",
-        "business_travel": "Travel Rarely",
-        "monthly_income": 11000,
-        "daily_rate": 1050,
-        "hourly_rate": 55,
-        "percent_salary_hike": 18,
-        "stock_option_level": 2,
-        "num_companies_worked": 2,
-        "total_working_years": 7,
-        "years_at_company": 5,
-        "years_in_current_role": 3,
-        "years_since_last_promotion": 1,
-        "years_with_curr_manager": 3,
-        "training_times_last_year": 3,
-        "environment_satisfaction": 4,
-        "job_satisfaction": 4,
-        "relationship_satisfaction": 4,
-        "work_life_balance": 3,
-        "job_involvement": 4,
-        "performance_rating": 3,
-    },
-    "Daniel": {
-        "age": 55,
-        "gender": "Male",
-        "marital_status": "Divorced",
-        "distance_from_home": 1,
-        "education": 3,
-        "education_field": "Other",
-        "department": "Research & Development",
-        "job_role": "Manufacturing Director",
-        "job_level": 5,
-        "overtime": "No",
-        "business_travel": "Non-Travel",
-        "monthly_income": 16000,
-        "daily_rate": 1400,
-        "hourly_rate": 75,
-        "percent_salary_hike": 16,
-        "stock_option_level": 3,
-        "num_companies_worked": 3,
-        "total_working_years": 32,
-        "years_at_company": 20,
-        "years_in_current_role": 15,
-        "years_since_last_promotion": 7,
-        "years_with_curr_manager": 12,
-        "training_times_last_year": 1,
-        "environment_satisfaction": 3,
-        "job_satisfaction": 3,
-        "relationship_satisfaction": 2,
-        "work_life_balance": 3,
-        "job_involvement": 3,
-        "performance_rating": 3,
-    },
-}
+    return prediction.features_from_profile(st.session_state)
+
+
+def get_scored_catalog():
+    """Catálogo pontuado da versão atual do modelo, do catálogo e das tabelas."""
+    import imputation
+
+    return load_scored_catalog(
+        scenario_catalog.file_version(prediction.MODEL_PATH),
+        scenario_catalog.file_version(scenario_catalog.CATALOG_PATH),
+        scenario_catalog.file_version(imputation.TABLES_PATH),
+    )
+
+
+def show_scenario_library():
+    """Tabela filtrável da biblioteca de cenários. Selecionar uma linha carrega o
+    cenário no formulário e mostra a predição pré-calculada."""
+    try:
+        catalogo, problemas = get_scored_catalog()
+    except Exception as e:
+        st.error(f"Não foi possível carregar a biblioteca de cenários: {e}")
+        return
+
+    if problemas:
+        st.warning(
+            f"{len(problemas)} cenário(s) de `{scenario_catalog.CATALOG_PATH}` "
+            "ignorado(s) por valores inválidos."
+        )
+        with st.expander("Ver cenários ignorados"):
+            for problema in problemas:
+                st.markdown(
+                    f"- Linha {problema['linha']} "
+                    f"(**{problema['nome'] or 'sem nome'}**): {problema['motivo']}"
+                )
+    if catalogo.empty:
+        st.info("Nenhum cenário válido na biblioteca.")
+        return
+
+    filtro1, filtro2, filtro3, filtro4 = st.columns(4)
+    busca = filtro1.text_input("Buscar por nome", key="cenario_busca")
+    departamentos = filtro2.multiselect(
+        "Departamento", sorted(catalogo["department"].unique()), key="cenario_depto"
+    )
+    cargos = filtro3.multiselect(
+        "Cargo", sorted(catalogo["job_role"].unique()), key="cenario_cargo"
+    )
+    faixa = filtro4.slider(
+        "Probabilidade de rotatividade (%)", 0, 100, (0, 100), key="cenario_faixa"
+    )
+
+    filtrado = scenario_catalog.filter_catalog(
+        catalogo, busca, departamentos, cargos, (faixa[0] / 100, faixa[1] / 100)
+    ).sort_values("Score", ascending=False)
+    exibido = filtrado.head(MAX_LINHAS_CATALOGO)
+    legenda = f"{len(filtrado)} de {len(catalogo)} cenários"
+    if len(filtrado) > MAX_LINHAS_CATALOGO:
+        legenda += f" (exibindo os {MAX_LINHAS_CATALOGO} de maior risco)"
+    st.caption(legenda + ". Clique nos cabeçalhos para ordenar.")
+
+    tabela = exibido[["department", "job_role", "job_level", "age", "monthly_income"]]
+    tabela = tabela.assign(
+        previsao=exibido["Label"].map({1: "Yes", 0: "No"}),
+        risco=exibido["Score"] * 100,
+    )
+    evento = st.dataframe(
+        tabela,
+        key="cenario_tabela",
+        on_select="rerun",
+        selection_mode="single-row",
+        use_container_width=True,
+        column_config={
+            "department": "Departamento",
+            "job_role": "Cargo",
+            "job_level": "Nível",
+            "age": "Idade",
+            "monthly_income": "Renda mensal",
+            "previsao": "Previsão",
+            "risco": st.column_config.ProgressColumn(
+                "Probabilidade", format="%.1f%%", min_value=0, max_value=100
+            ),
+        },
+    )
+
+    linhas = evento.selection.rows
+    if not linhas or linhas[0] >= len(exibido):
+        # Sem seleção, escolher de novo o mesmo cenário volta a carregá-lo
+        st.session_state.pop("cenario_aplicado", None)
+        return
+    nome = exibido.index[linhas[0]]
+    # Só sobrescreve o formulário quando a seleção muda, preservando as edições
+    if st.session_state.get("cenario_aplicado") != nome:
+        for chave, valor in scenario_catalog.get_profile(catalogo, nome).items():
+            st.session_state[chave] = valor
+        st.session_state["cenario_aplicado"] = nome
+
+    cenario = catalogo.loc[nome]
+    st.success(
+        f"Dados do cenário {nome} foram carregados!!! Revise e clique em confirmar"
+    )
+    st.info(
+        f"**Resultado pré-calculado:** {'Yes' if cenario['Label'] == 1 else 'No'} — "
+        f"probabilidade de rotatividade de {cenario['Score']:.2%}"
+    )
+
+
+def show_startup_metrics():
+    """Exibe na barra lateral os tempos de inicialização do processo."""
+    metricas = prediction.STARTUP_METRICS
+    with st.sidebar.expander("⏱️ Inicialização"):
+        if not prediction.warm_start_enabled():
+            st.caption("Inicialização a quente desativada (WARM_START=0).")
+            return
+        if not metricas:
+            st.caption("Modelo sendo carregado em segundo plano...")
+            return
+        st.write(f"Importações: {metricas['imports_s']:.2f} s")
+        st.write(f"Carga do modelo: {metricas['carga_modelo_s']:.2f} s")
+        st.write(f"Aquecimento: {metricas['aquecimento_s']:.2f} s")
+        st.write(f"Pronto para prever em: {metricas['primeira_predicao_s']:.2f} s")
 
 
 # ==================== MAIN ====================
 def main():
+    show_startup_metrics()
+
     # ----- Cabeçalho com imagem -----
     try:
+        from PIL import Image
+
         img = Image.open("./images/IBM_image.jpg")
         max_height = 500
         if img.height > max_height:
@@ -431,41 +236,44 @@ def main():
     st.markdown("---")
 
     # ----- Abas -----
-    tab1, tab2 = st.tabs(
-        ["📋 Ficha de cadastro para modelo de previsão", "📈 Apresentação de resultado"]
+    tab1, tab2, tab3 = st.tabs(
+        [
+            "📋 Ficha de cadastro para modelo de previsão",
+            "📈 Apresentação de resultado",
+            "📦 Pontuação em lote",
+        ]
     )
 
     # -------------------- ABA 1: FORMULÁRIO --------------------
     with tab1:
-        st.header("Preencha os dados do funcionário ou escolha um avatar")
+        st.header("Preencha os dados do funcionário ou escolha um cenário")
 
-        # Seletor de avatar
-        avatar_escolhido = st.selectbox(
-            "Carregar avatar de exemplo", ["Selecione..."] + list(avatares.keys())
-        )
-        if avatar_escolhido != "Selecione...":
-            dados_avatar = avatares[avatar_escolhido]
-            for chave, valor in dados_avatar.items():
-                st.session_state[chave.lower()] = valor
-            st.success(
-                f"Dados do avatar {avatar_escolhido} foram carregados!!! Revise e clique em confirmar"
-            )
+        # Biblioteca de cenários (pontuada sob demanda, não atrasa o primeiro render)
+        if st.toggle("🗂️ Abrir biblioteca de cenários", key="mostrar_cenarios"):
+            show_scenario_library()
         col1, col2 = st.columns(2)
 
         with col1:
             st.subheader("📌 Dados pessoais")
             st.number_input(
-                "Idade", min_value=18, max_value=65, value=35, step=1, key="age"
+                "Idade",
+                min_value=prediction.FORM_RANGES["age"][0],
+                max_value=prediction.FORM_RANGES["age"][1],
+                value=prediction.FORM_DEFAULTS["age"],
+                step=1,
+                key="age",
             )
-            st.selectbox("Gênero", ["Male", "Female"], key="gender")
+            st.selectbox("Gênero", prediction.FORM_OPTIONS["gender"], key="gender")
             st.selectbox(
-                "Estado civil", ["Single", "Married", "Divorced"], key="marital_status"
+                "Estado civil",
+                prediction.FORM_OPTIONS["marital_status"],
+                key="marital_status",
             )
             st.number_input(
                 "Distância de casa (km)",
-                min_value=0,
-                max_value=30,
-                value=5,
+                min_value=prediction.FORM_RANGES["distance_from_home"][0],
+                max_value=prediction.FORM_RANGES["distance_from_home"][1],
+                value=prediction.FORM_DEFAULTS["distance_from_home"],
                 step=1,
                 key="distance_from_home",
             )
@@ -473,7 +281,7 @@ def main():
             st.subheader("🎓 Formação")
             st.selectbox(
                 "Nível de educação",
-                [1, 2, 3, 4, 5],
+                prediction.FORM_OPTIONS["education"],
                 format_func=lambda x: [
                     "Below College",
                     "College",
@@ -485,14 +293,7 @@ def main():
             )
             st.selectbox(
                 "Área de formação",
-                [
-                    "Life Sciences",
-                    "Medical",
-                    "Marketing",
-                    "Technical Degree",
-                    "Human Resources",
-                    "Other",
-                ],
+                prediction.FORM_OPTIONS["education_field"],
                 key="education_field",
             )
 
@@ -500,67 +301,63 @@ def main():
             st.subheader("💼 Trabalho")
             st.selectbox(
                 "Departamento",
-                ["Sales", "Research & Development", "Human Resources"],
+                prediction.FORM_OPTIONS["department"],
                 key="department",
             )
             st.selectbox(
                 "Cargo",
-                [
-                    "Sales Executive",
-                    "Research Scientist",
-                    "Laboratory Technician",
-                    "Manufacturing Director",
-                    "Healthcare Representative",
-                    "Manager",
-                    "Sales Representative",
-                    "Research Director",
-                    "Human Resources",
-                ],
+                prediction.FORM_OPTIONS["job_role"],
                 key="job_role",
             )
-            st.selectbox("Nível de cargo", [1, 2, 3, 4, 5], key="job_level")
-            st.selectbox("Faz horas extras?", ["Yes", "No"], key="overtime")
+            st.selectbox(
+                "Nível de cargo", prediction.FORM_OPTIONS["job_level"], key="job_level"
+            )
+            st.selectbox(
+                "Faz horas extras?", prediction.FORM_OPTIONS["overtime"], key="overtime"
+            )
             st.selectbox(
                 "Frequência de viagens",
-                ["Travel Rarely", "Travel Frequently", "Non-Travel"],
+                prediction.FORM_OPTIONS["business_travel"],
                 key="business_travel",
             )
 
             st.subheader("💰 Remuneração")
             st.number_input(
                 "Renda mensal",
-                min_value=1000,
-                max_value=20000,
-                value=5000,
+                min_value=prediction.FORM_RANGES["monthly_income"][0],
+                max_value=prediction.FORM_RANGES["monthly_income"][1],
+                value=prediction.FORM_DEFAULTS["monthly_income"],
                 step=100,
                 key="monthly_income",
             )
             st.number_input(
                 "Diária média",
-                min_value=100,
-                max_value=2000,
-                value=800,
+                min_value=prediction.FORM_RANGES["daily_rate"][0],
+                max_value=prediction.FORM_RANGES["daily_rate"][1],
+                value=prediction.FORM_DEFAULTS["daily_rate"],
                 step=10,
                 key="daily_rate",
             )
             st.number_input(
                 "Salário por hora",
-                min_value=10,
-                max_value=80,
-                value=30,
+                min_value=prediction.FORM_RANGES["hourly_rate"][0],
+                max_value=prediction.FORM_RANGES["hourly_rate"][1],
+                value=prediction.FORM_DEFAULTS["hourly_rate"],
                 step=1,
                 key="hourly_rate",
             )
             st.number_input(
                 "% de aumento no último ano",
-                min_value=0,
-                max_value=30,
-                value=10,
+                min_value=prediction.FORM_RANGES["percent_salary_hike"][0],
+                max_value=prediction.FORM_RANGES["percent_salary_hike"][1],
+                value=prediction.FORM_DEFAULTS["percent_salary_hike"],
                 step=1,
                 key="percent_salary_hike",
             )
             st.selectbox(
-                "Nível de stock options", [0, 1, 2, 3], key="stock_option_level"
+                "Nível de stock options",
+                prediction.FORM_OPTIONS["stock_option_level"],
+                key="stock_option_level",
             )
 
             st.markdown("---")
@@ -570,57 +367,57 @@ def main():
                 st.subheader("⏳ Histórico profissional")
                 st.number_input(
                     "Nº de empresas trabalhadas",
-                    min_value=0,
-                    max_value=20,
-                    value=3,
+                    min_value=prediction.FORM_RANGES["num_companies_worked"][0],
+                    max_value=prediction.FORM_RANGES["num_companies_worked"][1],
+                    value=prediction.FORM_DEFAULTS["num_companies_worked"],
                     step=1,
                     key="num_companies_worked",
                 )
                 st.number_input(
                     "Anos totais de experiência",
-                    min_value=0,
-                    max_value=50,
-                    value=10,
+                    min_value=prediction.FORM_RANGES["total_working_years"][0],
+                    max_value=prediction.FORM_RANGES["total_working_years"][1],
+                    value=prediction.FORM_DEFAULTS["total_working_years"],
                     step=1,
                     key="total_working_years",
                 )
                 st.number_input(
                     "Anos na empresa atual",
-                    min_value=0,
-                    max_value=40,
-                    value=5,
+                    min_value=prediction.FORM_RANGES["years_at_company"][0],
+                    max_value=prediction.FORM_RANGES["years_at_company"][1],
+                    value=prediction.FORM_DEFAULTS["years_at_company"],
                     step=1,
                     key="years_at_company",
                 )
                 st.number_input(
                     "Anos no cargo atual",
-                    min_value=0,
-                    max_value=20,
-                    value=3,
+                    min_value=prediction.FORM_RANGES["years_in_current_role"][0],
+                    max_value=prediction.FORM_RANGES["years_in_current_role"][1],
+                    value=prediction.FORM_DEFAULTS["years_in_current_role"],
                     step=1,
                     key="years_in_current_role",
                 )
                 st.number_input(
                     "Anos desde última promoção",
-                    min_value=0,
-                    max_value=20,
-                    value=1,
+                    min_value=prediction.FORM_RANGES["years_since_last_promotion"][0],
+                    max_value=prediction.FORM_RANGES["years_since_last_promotion"][1],
+                    value=prediction.FORM_DEFAULTS["years_since_last_promotion"],
                     step=1,
                     key="years_since_last_promotion",
                 )
                 st.number_input(
                     "Anos com o gestor atual",
-                    min_value=0,
-                    max_value=20,
-                    value=2,
+                    min_value=prediction.FORM_RANGES["years_with_curr_manager"][0],
+                    max_value=prediction.FORM_RANGES["years_with_curr_manager"][1],
+                    value=prediction.FORM_DEFAULTS["years_with_curr_manager"],
                     step=1,
                     key="years_with_curr_manager",
                 )
                 st.number_input(
                     "Treinamentos no último ano",
-                    min_value=0,
-                    max_value=10,
-                    value=2,
+                    min_value=prediction.FORM_RANGES["training_times_last_year"][0],
+                    max_value=prediction.FORM_RANGES["training_times_last_year"][1],
+                    value=prediction.FORM_DEFAULTS["training_times_last_year"],
                     step=1,
                     key="training_times_last_year",
                 )
@@ -629,7 +426,7 @@ def main():
                 st.subheader("😊 Satisfação e avaliação")
                 st.selectbox(
                     "Satisfação com o ambiente",
-                    [1, 2, 3, 4],
+                    prediction.FORM_OPTIONS["environment_satisfaction"],
                     format_func=lambda x: ["Baixa", "Média", "Alta", "Muito alta"][
                         x - 1
                     ],
@@ -637,7 +434,7 @@ def main():
                 )
                 st.selectbox(
                     "Satisfação com o trabalho",
-                    [1, 2, 3, 4],
+                    prediction.FORM_OPTIONS["job_satisfaction"],
                     format_func=lambda x: ["Baixa", "Média", "Alta", "Muito alta"][
                         x - 1
                     ],
@@ -645,7 +442,7 @@ def main():
                 )
                 st.selectbox(
                     "Satisfação com relacionamentos",
-                    [1, 2, 3, 4],
+                    prediction.FORM_OPTIONS["relationship_satisfaction"],
                     format_func=lambda x: ["Baixa", "Média", "Alta", "Muito alta"][
                         x - 1
                     ],
@@ -653,7 +450,7 @@ def main():
                 )
                 st.selectbox(
                     "Equilíbrio trabalho-vida",
-                    [1, 2, 3, 4],
+                    prediction.FORM_OPTIONS["work_life_balance"],
                     format_func=lambda x: ["Ruim", "Regular", "Bom", "Excelente"][
                         x - 1
                     ],
@@ -661,7 +458,7 @@ def main():
                 )
                 st.selectbox(
                     "Envolvimento com o trabalho",
-                    [1, 2, 3, 4],
+                    prediction.FORM_OPTIONS["job_involvement"],
                     format_func=lambda x: ["Baixo", "Médio", "Alto", "Muito alto"][
                         x - 1
                     ],
@@ -669,7 +466,7 @@ def main():
                 )
                 st.selectbox(
                     "Avaliação de desempenho",
-                    [1, 2, 3, 4],
+                    prediction.FORM_OPTIONS["performance_rating"],
                     format_func=lambda x: ["Ruim", "Regular", "Bom", "Excelente"][
                         x - 1
                     ],
@@ -684,48 +481,26 @@ def main():
         if st.button(
             "🔍 Confirmar e gerar previsão", type="primary", use_container_width=True
         ):
-            # --- 1. Carregar médias e modelo ---
-            monthly_rate_avg = load_monthly_rate_avg()
+            # --- 1. Carregar tabelas de imputação e modelo ---
+            imputer = load_monthly_rate_imputer()
             modelo = load_model()
 
-            # --- 2. Calcular fallback para MonthlyRate (média geral) ---
-            if monthly_rate_avg:
-                media_geral_monthly_rate = np.mean(list(monthly_rate_avg.values()))
-            else:
-                media_geral_monthly_rate = (
-                    800.0  # valor padrão caso o JSON esteja vazio
-                )
+            # --- 2. Montar dicionário de features ---
+            features = build_features_from_session()
 
-            # --- 3. Obter cargo e estimar MonthlyRate ---
-            job_role = st.session_state.get("job_role")
-            monthly_rate_estimado = monthly_rate_avg.get(
-                job_role, media_geral_monthly_rate
-            )
+            # --- 3. Estimar MonthlyRate pelas tabelas de imputação ---
+            features["MonthlyRate"] = imputer.resolve_one(features)
 
-            # --- 4. Montar dicionário de features ---
-            features = build_features_from_session()
-            features["MonthlyRate"] = monthly_rate_estimado
-
-            # --- 5. Criar DataFrame e adicionar colunas constantes ---
-            df_input = pd.DataFrame([features])
-
-            # Colunas que são fixas no dataset original
-            df_input["EmployeeCount"] = 1
-            df_input["Over18"] = "Y"
-            df_input["StandardHours"] = 80
-            # EmployeeNumber: usar 0 em vez de NaN (é apenas um identificador)
-            df_input["EmployeeNumber"] = 0
-
-            # --- 6. Garantir a ordem correta das colunas (conforme treinamento) ---
-            colunas_esperadas = modelo.feature_names_in_
-            # Verifica se todas as colunas esperadas estão presentes
-            for col in colunas_esperadas:
-                if col not in df_input.columns:
-                    st.error(f"Coluna '{col}' não encontrada nos dados de entrada.")
-                    st.stop()
-            df_input = df_input[colunas_esperadas]
-
-            # --- 7. Verificar se ainda há valores nulos ---
+            # --- 4. Criar DataFrame com as colunas constantes, na ordem do treinamento ---
+            try:
+                df_input = prediction.build_input_frame(
+                    features, modelo.feature_names_in_
+                )
+            except KeyError as e:
+                st.error(f"Coluna '{e.args[0]}' não encontrada nos dados de entrada.")
+                st.stop()
+
+            # --- 5. Verificar se ainda há valores nulos ---
             if df_input.isnull().any().any():
                 st.warning(
                     "Ainda existem valores nulos no DataFrame. Verifique as colunas abaixo:"
@@ -737,11 +512,11 @@ def main():
                 )
                 st.stop()
 
-            # --- 8. Realizar predição ---
+            # --- 6. Realizar predição ---
             pred_num = modelo.predict(df_input)[0]
             proba = modelo.predict_proba(df_input)[0]
 
-            # --- 9. Exibir resultados ---
+            # --- 7. Exibir resultados ---
             st.success(f"### Resultado: **{'Yes' if pred_num == 1 else 'No'}**")
             st.info(f"**Probabilidade de rotatividade:** {proba[1]:.2%}")
 
@@ -749,6 +524,54 @@ def main():
             with st.expander("📋 Dados utilizados na previsão"):
                 st.dataframe(df_input.T.rename(columns={0: "Valor"}))
 
+    # -------------------- ABA 3: PONTUAÇÃO EM LOTE --------------------
+    with tab3:
+        st.header("Pontuação em lote")
+        st.caption(
+            "Envie um arquivo Parquet, Arrow (IPC/Feather) ou CSV com os dados dos "
+            "funcionários. Apenas as colunas usadas pelo modelo são lidas, em lotes."
+        )
+
+        arquivo = st.file_uploader(
+            "Arquivo de funcionários",
+            type=["parquet", "pq", "arrow", "feather", "ipc", "arrows", "csv"],
+        )
+        if arquivo is not None and st.button(
+            "📦 Pontuar arquivo", type="primary", use_container_width=True
+        ):
+            import batch_scoring
+
+            try:
+                formato = batch_scoring.detect_format(arquivo.name)
+                resultado = batch_scoring.score_table(
+                    arquivo, load_model(), load_monthly_rate_imputer(), formato
+                )
+            except KeyError as e:
+                st.error(f"Coluna '{e.args[0]}' não encontrada no arquivo.")
+                st.stop()
+            except Exception as e:
+                st.error(f"Não foi possível pontuar o arquivo: {e}")
+                st.stop()
+
+            if resultado.num_rows == 0:
+                st.warning("O arquivo não contém linhas para pontuar.")
+                st.stop()
+
+            scores = resultado.column("Score").to_numpy()
+            previstos = int(resultado.column("Label").to_numpy().sum())
+            st.success(f"### {resultado.num_rows} funcionários pontuados")
+            st.info(
+                f"**Probabilidade média de rotatividade:** {scores.mean():.2%} — "
+                f"**previstos como 'Yes':** {previstos}"
+            )
+            st.dataframe(resultado.slice(0, 1000).to_pandas())
+            st.download_button(
+                "⬇️ Baixar predições (Parquet)",
+                batch_scoring.table_to_parquet_bytes(resultado),
+                file_name="predicoes.parquet",
+                mime="application/octet-stream",
+            )
+
 
 # ==================== EXECUÇÃO ====================
 if __name__ == "__main__":
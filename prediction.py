@@ -0,0 +1,312 @@
+import os
+import threading
+import time
+
+# pandas, numpy, joblib e scikit-learn são importados sob demanda (dentro das
+# funções) para que o primeiro render do app não pague o custo dessas importações.
+
+
+def _process_age():
+    """Segundos desde o início do processo, lidos de /proc (Linux); ``None`` se
+    indisponível."""
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # Os campos após o nome do executável começam no campo 3; starttime é o 22
+            campos = f.read().rsplit(")", 1)[1].split()
+        inicio = int(campos[19]) / os.sysconf("SC_CLK_TCK")
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        return max(uptime - inicio, 0.0)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+# Relógio de referência da inicialização: início do processo quando /proc está
+# disponível; senão, a primeira importação deste módulo
+_PROCESS_T0 = time.perf_counter() - (_process_age() or 0.0)
+
+MODEL_PATH = "modelo_naive_bayes_02_02_2026.pkl"
+
+# Mapeamento entre as chaves do session_state (formulário) e as features do modelo
+SESSION_TO_FEATURE = {
+    "age": "Age",
+    "gender": "Gender",
+    "marital_status": "MaritalStatus",
+    "distance_from_home": "DistanceFromHome",
+    "education": "Education",
+    "education_field": "EducationField",
+    "department": "Department",
+    "job_role": "JobRole",
+    "job_level": "JobLevel",
+    "overtime": "OverTime",
+    "business_travel": "BusinessTravel",
+    "monthly_income": "MonthlyIncome",
+    "daily_rate": "DailyRate",
+    "hourly_rate": "HourlyRate",
+    "percent_salary_hike": "PercentSalaryHike",
+    "stock_option_level": "StockOptionLevel",
+    "num_companies_worked": "NumCompaniesWorked",
+    "total_working_years": "TotalWorkingYears",
+    "years_at_company": "YearsAtCompany",
+    "years_in_current_role": "YearsInCurrentRole",
+    "years_since_last_promotion": "YearsSinceLastPromotion",
+    "years_with_curr_manager": "YearsWithCurrManager",
+    "training_times_last_year": "TrainingTimesLastYear",
+    "environment_satisfaction": "EnvironmentSatisfaction",
+    "job_satisfaction": "JobSatisfaction",
+    "relationship_satisfaction": "RelationshipSatisfaction",
+    "work_life_balance": "WorkLifeBalance",
+    "job_involvement": "JobInvolvement",
+    "performance_rating": "PerformanceRating",
+}
+
+# Opções dos campos de seleção do formulário (a primeira é o valor padrão)
+FORM_OPTIONS = {
+    "gender": ["Male", "Female"],
+    "marital_status": ["Single", "Married", "Divorced"],
+    "education": [1, 2, 3, 4, 5],
+    "education_field": [
+        "Life Sciences",
+        "Medical",
+        "Marketing",
+        "Technical Degree",
+        "Human Resources",
+        "Other",
+    ],
+    "department": ["Sales", "Research & Development", "Human Resources"],
+    "job_role": [
+        "Sales Executive",
+        "Research Scientist",
+        "Laboratory Technician",
+        "Manufacturing Director",
+        "Healthcare Representative",
+        "Manager",
+        "Sales Representative",
+        "Research Director",
+        "Human Resources",
+    ],
+    "job_level": [1, 2, 3, 4, 5],
+    "overtime": ["Yes", "No"],
+    "business_travel": ["Travel Rarely", "Travel Frequently", "Non-Travel"],
+    "stock_option_level": [0, 1, 2, 3],
+    "environment_satisfaction": [1, 2, 3, 4],
+    "job_satisfaction": [1, 2, 3, 4],
+    "relationship_satisfaction": [1, 2, 3, 4],
+    "work_life_balance": [1, 2, 3, 4],
+    "job_involvement": [1, 2, 3, 4],
+    "performance_rating": [1, 2, 3, 4],
+}
+
+# Limites (mínimo, máximo) dos campos numéricos inteiros do formulário
+FORM_RANGES = {
+    "age": (18, 65),
+    "distance_from_home": (0, 30),
+    "monthly_income": (1000, 20000),
+    "daily_rate": (100, 2000),
+    "hourly_rate": (10, 80),
+    "percent_salary_hike": (0, 30),
+    "num_companies_worked": (0, 20),
+    "total_working_years": (0, 50),
+    "years_at_company": (0, 40),
+    "years_in_current_role": (0, 20),
+    "years_since_last_promotion": (0, 20),
+    "years_with_curr_manager": (0, 20),
+    "training_times_last_year": (0, 10),
+}
+
+# Valores iniciais dos campos numéricos do formulário
+FORM_DEFAULTS = {
+    "age": 35,
+    "distance_from_home": 5,
+    "monthly_income": 5000,
+    "daily_rate": 800,
+    "hourly_rate": 30,
+    "percent_salary_hike": 10,
+    "num_companies_worked": 3,
+    "total_working_years": 10,
+    "years_at_company": 5,
+    "years_in_current_role": 3,
+    "years_since_last_promotion": 1,
+    "years_with_curr_manager": 2,
+    "training_times_last_year": 2,
+}
+
+# Colunas que são fixas no dataset original
+CONSTANT_COLUMNS = {
+    "EmployeeCount": 1,
+    "Over18": "Y",
+    "StandardHours": 80,
+    # EmployeeNumber: usar 0 em vez de NaN (é apenas um identificador)
+    "EmployeeNumber": 0,
+}
+
+
+# ==================== CARREGAMENTO ====================
+def load_model(path=MODEL_PATH):
+    """Carrega o modelo treinado (pipeline scikit-learn salvo com joblib)."""
+    import joblib
+
+    return joblib.load(path)
+
+
+def load_monthly_rate_imputer(path=None):
+    """Carrega as tabelas de imputação de MonthlyRate (ver ``imputation.py``)."""
+    import imputation
+
+    return imputation.MonthlyRateImputer.from_json(path or imputation.TABLES_PATH)
+
+
+# ==================== MONTAGEM DAS FEATURES ====================
+def default_profile():
+    """Perfil com os valores iniciais do formulário, no formato do session_state."""
+    perfil = {chave: opcoes[0] for chave, opcoes in FORM_OPTIONS.items()}
+    perfil.update(FORM_DEFAULTS)
+    return perfil
+
+
+def features_from_profile(perfil):
+    """Converte um perfil no formato do session_state em um dicionário de features."""
+    return {
+        feature: perfil.get(chave) for chave, feature in SESSION_TO_FEATURE.items()
+    }
+
+
+def build_input_frame(features, colunas_esperadas):
+    """Monta o DataFrame de entrada na ordem de colunas usada no treinamento.
+
+    Levanta ``KeyError`` com o nome da primeira coluna esperada ausente.
+    """
+    import pandas as pd
+
+    df_input = pd.DataFrame([features])
+    for coluna, valor in CONSTANT_COLUMNS.items():
+        df_input[coluna] = valor
+
+    for col in colunas_esperadas:
+        if col not in df_input.columns:
+            raise KeyError(col)
+    return df_input[colunas_esperadas]
+
+
+def predict_features(modelo, features, imputer):
+    """Executa o caminho completo de predição para um dicionário de features.
+
+    ``MonthlyRate`` é sempre estimado pelas tabelas de imputação, como no
+    formulário do app.
+    Retorna a tupla ``(classe_prevista, probabilidade_de_rotatividade)``.
+    """
+    features = dict(features)
+    features["MonthlyRate"] = imputer.resolve_one(features)
+    df_input = build_input_frame(features, modelo.feature_names_in_)
+    pred_num = modelo.predict(df_input)[0]
+    proba = modelo.predict_proba(df_input)[0]
+    return pred_num, proba[1]
+
+
+# ==================== INICIALIZAÇÃO A QUENTE ====================
+# Métricas de inicialização, em segundos (``primeira_predicao_s`` é contado desde
+# o início do processo)
+STARTUP_METRICS = {}
+
+_warm_lock = threading.Lock()
+_warm_thread = None
+
+
+def warm_start_enabled():
+    """Indica se o modo de inicialização a quente está ativo (variável WARM_START)."""
+    return os.environ.get("WARM_START", "1").lower() not in ("0", "false", "no")
+
+
+def _warm_up(resultado):
+    try:
+        t0 = time.perf_counter()
+        import joblib  # noqa: F401
+        import numpy  # noqa: F401
+        import pandas  # noqa: F401
+        import sklearn.compose  # noqa: F401
+        import sklearn.naive_bayes  # noqa: F401
+        import sklearn.pipeline  # noqa: F401
+
+        t1 = time.perf_counter()
+        modelo = load_model()
+        imputer = load_monthly_rate_imputer()
+        t2 = time.perf_counter()
+    except Exception as e:
+        print(f"[startup] falha na carga do modelo: {e}", flush=True)
+        resultado["erro"] = e
+        return
+
+    resultado["modelo"] = modelo
+    resultado["imputer"] = imputer
+    try:
+        # Uma predição descartável aquece o pipeline (OneHotEncoder, GaussianNB).
+        # Usa o perfil padrão do formulário, sem depender da biblioteca de cenários.
+        predict_features(modelo, features_from_profile(default_profile()), imputer)
+    except Exception as e:
+        # O modelo já carregado continua utilizável; só o aquecimento se perde
+        print(f"[startup] falha na predição de aquecimento: {e}", flush=True)
+    t3 = time.perf_counter()
+
+    STARTUP_METRICS.update(
+        {
+            "imports_s": t1 - t0,
+            "carga_modelo_s": t2 - t1,
+            "aquecimento_s": t3 - t2,
+            "primeira_predicao_s": t3 - _PROCESS_T0,
+        }
+    )
+    print(
+        "[startup] imports {imports_s:.2f}s | modelo {carga_modelo_s:.2f}s | "
+        "aquecimento {aquecimento_s:.2f}s | pronto para prever em "
+        "{primeira_predicao_s:.2f}s desde o início do processo".format(
+            **STARTUP_METRICS
+        ),
+        flush=True,
+    )
+
+
+def warm_start():
+    """Inicia (uma única vez por processo) a carga e o aquecimento do modelo em
+    segundo plano e devolve a thread responsável."""
+    global _warm_thread
+    with _warm_lock:
+        if _warm_thread is None:
+            # Cada tentativa guarda seu próprio resultado (modelo ou exceção)
+            resultado = {}
+            _warm_thread = threading.Thread(
+                target=_warm_up,
+                args=(resultado,),
+                name="warm-start",
+                daemon=True,
+            )
+            _warm_thread.resultado = resultado
+            _warm_thread.start()
+        return _warm_thread
+
+
+def _warm_result():
+    """Aguarda o aquecimento (iniciando-o, se necessário) e devolve o resultado.
+
+    Se a carga do modelo em segundo plano falhou, descarta a tentativa, para que
+    a próxima chamada tente de novo, e relança a exceção original. Uma falha só
+    na predição de aquecimento não impede a entrega do modelo.
+    """
+    global _warm_thread
+    thread = warm_start()
+    thread.join()
+    if "erro" in thread.resultado:
+        with _warm_lock:
+            if _warm_thread is thread:
+                _warm_thread = None
+        raise thread.resultado["erro"]
+    return thread.resultado
+
+
+def get_warm_model():
+    """Devolve o modelo carregado e aquecido em segundo plano."""
+    return _warm_result()["modelo"]
+
+
+def get_warm_imputer():
+    """Devolve as tabelas de imputação já montadas pelo aquecimento."""
+    return _warm_result()["imputer"]
@@ -0,0 +1,154 @@
+"""Biblioteca de cenários: perfis nomeados para treinamentos e auditorias.
+
+Os cenários ficam em ``cenarios.csv``, uma linha por perfil, com a coluna
+``nome`` e as mesmas chaves do session_state do formulário. O catálogo inteiro
+é pontuado de uma vez (uma única chamada a ``predict_proba``), e o resultado é
+guardado em cache por versão do modelo, do catálogo e das tabelas de
+imputação, de modo que escolher um cenário mostra a predição na hora.
+
+Ao carregar, cada linha é conferida contra as opções e limites do formulário
+(``prediction.FORM_OPTIONS`` e ``prediction.FORM_RANGES``); linhas inválidas
+são descartadas e listadas, sem derrubar a biblioteca inteira.
+"""
+
+import os
+
+import prediction
+
+CATALOG_PATH = "cenarios.csv"
+NAME_COLUMN = "nome"
+
+
+def file_version(path):
+    """Identifica a versão de um arquivo por nome, tamanho e data de modificação."""
+    info = os.stat(path)
+    return f"{os.path.basename(path)}:{info.st_size}:{info.st_mtime_ns}"
+
+
+def read_catalog(path=CATALOG_PATH):
+    """Lê o catálogo e separa os cenários válidos dos inválidos.
+
+    Devolve ``(catalogo, problemas)``: o catálogo indexado pelo nome, só com as
+    linhas válidas, e a lista de linhas descartadas (``linha`` no arquivo,
+    ``nome`` e ``motivo``). Levanta ``ValueError`` se faltarem colunas do
+    formulário, já que nesse caso nenhum cenário pode ser usado.
+    """
+    import pandas as pd
+
+    bruto = pd.read_csv(path)
+    esperadas = [NAME_COLUMN, *prediction.SESSION_TO_FEATURE]
+    faltantes = [c for c in esperadas if c not in bruto]
+    if faltantes:
+        raise ValueError(f"Colunas ausentes no catálogo: {', '.join(faltantes)}")
+    return validate_catalog(bruto)
+
+
+def validate_catalog(bruto):
+    """Confere cada linha contra as opções e limites do formulário.
+
+    Uma linha é descartada se o nome estiver vazio ou repetido (fica a
+    primeira), se algum campo for nulo, se um campo de seleção tiver valor fora
+    das opções ou se um campo numérico não for inteiro ou sair dos limites.
+    """
+    import pandas as pd
+
+    motivos = pd.DataFrame(index=bruto.index)
+    nomes = bruto[NAME_COLUMN].fillna("").astype(str).str.strip()
+    motivos["nome vazio"] = nomes == ""
+    motivos["nome repetido"] = nomes.duplicated() & ~motivos["nome vazio"]
+
+    for chave, opcoes in prediction.FORM_OPTIONS.items():
+        coluna = bruto[chave]
+        motivos[f"{chave} vazio"] = coluna.isna()
+        # Opções numéricas aceitam 2 ou 2.0 (o CSV pode ler a coluna como float)
+        if isinstance(opcoes[0], str):
+            valida = coluna.isin(opcoes)
+        else:
+            valida = pd.to_numeric(coluna, errors="coerce").isin(opcoes)
+        motivos[f"{chave} fora das opções"] = coluna.notna() & ~valida
+
+    for chave, (minimo, maximo) in prediction.FORM_RANGES.items():
+        coluna = bruto[chave]
+        numeros = pd.to_numeric(coluna, errors="coerce")
+        motivos[f"{chave} vazio"] = coluna.isna()
+        motivos[f"{chave} não inteiro"] = coluna.notna() & (
+            numeros.isna() | (numeros % 1 != 0)
+        )
+        motivos[f"{chave} fora de [{minimo}, {maximo}]"] = (
+            numeros.notna() & (numeros % 1 == 0) & ~numeros.between(minimo, maximo)
+        )
+
+    invalidas = motivos.any(axis=1)
+    problemas = [
+        {
+            # Linha no arquivo: +1 pelo cabeçalho e +1 por contar a partir de 1
+            "linha": int(posicao) + 2,
+            "nome": nomes.at[posicao],
+            "motivo": ", ".join(motivos.columns[motivos.loc[posicao].to_numpy()]),
+        }
+        for posicao in bruto.index[invalidas]
+    ]
+
+    colunas = [NAME_COLUMN, *prediction.SESSION_TO_FEATURE]
+    catalogo = bruto.loc[~invalidas, colunas].copy()
+    catalogo[NAME_COLUMN] = nomes[~invalidas]
+    # Campos numéricos voltam a inteiros, como os valores dos widgets
+    numericas = [
+        chave
+        for chave, opcoes in prediction.FORM_OPTIONS.items()
+        if not isinstance(opcoes[0], str)
+    ] + list(prediction.FORM_RANGES)
+    catalogo[numericas] = catalogo[numericas].apply(pd.to_numeric).astype("int64")
+    return catalogo.set_index(NAME_COLUMN), problemas
+
+
+def load_catalog(path=CATALOG_PATH):
+    """Lê o catálogo indexado pelo nome do cenário, só com as linhas válidas
+    (ver ``read_catalog``)."""
+    return read_catalog(path)[0]
+
+
+def get_profile(catalogo, cenario):
+    """Devolve um cenário (pelo nome ou pela posição) no formato do session_state,
+    com tipos nativos do Python."""
+    if isinstance(cenario, int):
+        linha = catalogo.iloc[[cenario]]
+    else:
+        linha = catalogo.loc[[cenario]]
+    return linha[list(prediction.SESSION_TO_FEATURE)].to_dict("records")[0]
+
+
+def score_catalog(catalogo, modelo, imputer):
+    """Pontua o catálogo inteiro em lote e devolve-o com ``Label`` e ``Score``."""
+    from imputation import DIMENSOES
+
+    features = catalogo[list(prediction.SESSION_TO_FEATURE)].rename(
+        columns=prediction.SESSION_TO_FEATURE
+    )
+    features["MonthlyRate"] = imputer.resolve(
+        {d: features[d] for d in DIMENSOES}, len(features)
+    )
+    for coluna, valor in prediction.CONSTANT_COLUMNS.items():
+        features[coluna] = valor
+
+    probas = modelo.predict_proba(features[list(modelo.feature_names_in_)])
+    resultado = catalogo.copy()
+    resultado["Label"] = modelo.classes_.take(probas.argmax(axis=1))
+    resultado["Score"] = probas[:, 1]
+    return resultado
+
+
+def filter_catalog(catalogo, busca="", departamentos=(), cargos=(), faixa=(0.0, 1.0)):
+    """Filtra o catálogo pontuado com máscaras vetorizadas.
+
+    ``busca`` procura no nome (sem diferenciar maiúsculas), ``departamentos`` e
+    ``cargos`` restringem quando não vazios e ``faixa`` limita o ``Score``.
+    """
+    mascara = catalogo["Score"].between(*faixa)
+    if busca:
+        mascara &= catalogo.index.str.contains(busca, case=False, regex=False)
+    if departamentos:
+        mascara &= catalogo["department"].isin(departamentos)
+    if cargos:
+        mascara &= catalogo["job_role"].isin(cargos)
+    return catalogo[mascara]
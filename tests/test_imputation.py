@@ -0,0 +1,93 @@
+import csv
+import json
+import os
+
+import pytest
+
+import imputation
+
+TABELAS_REAIS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    imputation.TABLES_PATH,
+)
+
+# Cargo A tem médias por nível; B só por cargo; C não aparece em nenhuma tabela
+TABELAS = {
+    "alvo": "MonthlyRate",
+    "niveis": [
+        {
+            "chaves": ["JobRole", "JobLevel"],
+            "valores": [["A", 1, 100.0, 10], ["A", 2, 200.0, 10]],
+        },
+        {"chaves": ["JobRole"], "valores": [["A", 150.0, 20], ["B", 300.0, 8]]},
+        {
+            "chaves": ["Department"],
+            "valores": [["Sales", 400.0, 30], ["R&D", 500.0, 50]],
+        },
+    ],
+    "global": 450.0,
+}
+
+
+@pytest.fixture
+def imputer():
+    return imputation.MonthlyRateImputer(TABELAS)
+
+
+@pytest.mark.parametrize(
+    "cargo, nivel, departamento, esperado",
+    [
+        ("A", 1, "Sales", 100.0),  # cargo x nível sobrescreve cargo e departamento
+        ("A", 2, "R&D", 200.0),
+        ("A", 3, "Sales", 150.0),  # nível desconhecido para o cargo -> cargo
+        ("B", 1, "R&D", 300.0),  # cargo sem médias por nível -> cargo
+        ("C", 1, "Sales", 400.0),  # cargo desconhecido -> departamento
+        ("C", 9, "Finance", 450.0),  # nada conhecido -> média global
+        (None, None, None, 450.0),
+    ],
+)
+def test_hierarquia_resolvida_no_indice(imputer, cargo, nivel, departamento, esperado):
+    features = {"JobRole": cargo, "JobLevel": nivel, "Department": departamento}
+    assert imputer.resolve_one(features) == pytest.approx(esperado)
+
+
+def test_lote_e_dimensoes_ausentes(imputer):
+    estimado = imputer.resolve({"JobRole": ["A", "B", "C"], "JobLevel": [2, 2, 2]}, 3)
+    # Sem Department, o cargo desconhecido cai direto na média global
+    assert list(estimado) == pytest.approx([200.0, 300.0, 450.0])
+
+
+def test_grupos_pequenos_caem_para_o_cargo(tmp_path):
+    path = tmp_path / "dataset.csv"
+    linhas = [("A", 1, "Sales", 100)] * 5 + [("A", 3, "Sales", 1000)] * 2
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.writer(f)
+        escritor.writerow(["JobRole", "JobLevel", "Department", "MonthlyRate"])
+        escritor.writerows(linhas)
+
+    tabelas = imputation.build_tables(str(path), min_linhas=5)
+    assert tabelas["niveis"][0]["valores"] == [["A", 1, 100.0, 5]]
+
+    imputer = imputation.MonthlyRateImputer(tabelas)
+    media_cargo = (5 * 100 + 2 * 1000) / 7
+    assert imputer.resolve_one(
+        {"JobRole": "A", "JobLevel": 3, "Department": "Sales"}
+    ) == pytest.approx(media_cargo)
+
+
+def test_tabelas_do_repositorio_usam_media_do_cargo_para_grupo_pequeno():
+    with open(TABELAS_REAIS, encoding="utf-8") as f:
+        tabelas = json.load(f)
+    imputer = imputation.MonthlyRateImputer(tabelas)
+    por_nivel = {(c, n) for c, n, *_ in tabelas["niveis"][0]["valores"]}
+    por_cargo = {c: media for c, media, _ in tabelas["niveis"][1]["valores"]}
+    assert ("Laboratory Technician", 3) not in por_nivel
+
+    estimado = imputer.resolve_one(
+        {
+            "JobRole": "Laboratory Technician",
+            "JobLevel": 3,
+            "Department": "Research & Development",
+        }
+    )
+    assert estimado == pytest.approx(por_cargo["Laboratory Technician"])
@@ -0,0 +1,64 @@
+import pytest
+
+import prediction
+
+
+@pytest.fixture
+def aquecimento_limpo(monkeypatch):
+    monkeypatch.setattr(prediction, "_warm_thread", None)
+    monkeypatch.setattr(prediction, "STARTUP_METRICS", {})
+
+
+def test_perfil_padrao_respeita_o_formulario():
+    perfil = prediction.default_profile()
+
+    assert set(perfil) == set(prediction.SESSION_TO_FEATURE)
+    for chave, opcoes in prediction.FORM_OPTIONS.items():
+        assert perfil[chave] in opcoes
+    for chave, (minimo, maximo) in prediction.FORM_RANGES.items():
+        assert minimo <= perfil[chave] <= maximo
+
+
+def test_falha_no_aquecimento_ainda_entrega_o_modelo(aquecimento_limpo, monkeypatch):
+    modelo = object()
+    monkeypatch.setattr(prediction, "load_model", lambda: modelo)
+    monkeypatch.setattr(prediction, "load_monthly_rate_imputer", lambda: object())
+
+    def falha(*args):
+        raise ValueError("predição de aquecimento")
+
+    monkeypatch.setattr(prediction, "predict_features", falha)
+
+    assert prediction.get_warm_model() is modelo
+
+
+def test_falha_na_carga_permite_nova_tentativa(aquecimento_limpo, monkeypatch):
+    tentativas = []
+
+    def carga_com_falha():
+        tentativas.append(1)
+        raise OSError("modelo ausente")
+
+    monkeypatch.setattr(prediction, "load_model", carga_com_falha)
+
+    for _ in range(2):
+        with pytest.raises(OSError):
+            prediction.get_warm_model()
+    assert len(tentativas) == 2
+
+
+def test_imputer_do_aquecimento_e_reaproveitado(aquecimento_limpo, monkeypatch):
+    imputer = object()
+    cargas = []
+
+    def carga_imputer():
+        cargas.append(1)
+        return imputer
+
+    monkeypatch.setattr(prediction, "load_model", lambda: object())
+    monkeypatch.setattr(prediction, "load_monthly_rate_imputer", carga_imputer)
+    monkeypatch.setattr(prediction, "predict_features", lambda *args: None)
+
+    prediction.get_warm_model()
+    assert prediction.get_warm_imputer() is imputer
+    assert len(cargas) == 1
@@ -0,0 +1,83 @@
+import csv
+import os
+
+import pytest
+
+import scenario_catalog
+
+CATALOGO_REAL = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    scenario_catalog.CATALOG_PATH,
+)
+
+
+def _linha_valida():
+    with open(CATALOGO_REAL, newline="", encoding="utf-8") as f:
+        return next(csv.DictReader(f))
+
+
+def _grava_catalogo(path, linhas):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.DictWriter(f, fieldnames=list(linhas[0]))
+        escritor.writeheader()
+        escritor.writerows(linhas)
+    return str(path)
+
+
+@pytest.fixture
+def catalogo_ruim(tmp_path):
+    base = _linha_valida()
+    linhas = [
+        dict(base, nome="Valido"),
+        dict(base, nome="Sem idade", age=""),
+        dict(base, nome="Nivel seis", job_level="6"),
+        dict(base, nome="Idade setenta", age="70"),
+        dict(base, nome="Viagem desconhecida", business_travel="Sometimes"),
+        dict(base, nome="Idade fracionada", age="35.5"),
+        dict(base, nome="Valido"),
+        dict(base, nome=""),
+        dict(base, nome="Outro valido", job_level="3"),
+    ]
+    return _grava_catalogo(tmp_path / "cenarios.csv", linhas)
+
+
+def test_descarta_linhas_invalidas(catalogo_ruim):
+    catalogo, problemas = scenario_catalog.read_catalog(catalogo_ruim)
+
+    assert list(catalogo.index) == ["Valido", "Outro valido"]
+    motivos = {p["linha"]: (p["nome"], p["motivo"]) for p in problemas}
+    assert motivos == {
+        3: ("Sem idade", "age vazio"),
+        4: ("Nivel seis", "job_level fora das opções"),
+        5: ("Idade setenta", "age fora de [18, 65]"),
+        6: ("Viagem desconhecida", "business_travel fora das opções"),
+        7: ("Idade fracionada", "age não inteiro"),
+        8: ("Valido", "nome repetido"),
+        9: ("", "nome vazio"),
+    }
+
+
+def test_perfis_validos_usam_tipos_do_formulario(catalogo_ruim):
+    catalogo = scenario_catalog.load_catalog(catalogo_ruim)
+    perfil = scenario_catalog.get_profile(catalogo, "Outro valido")
+
+    # A coluna age tem um valor vazio no arquivo e é lida como float
+    assert type(perfil["age"]) is int
+    assert type(perfil["job_level"]) is int
+    assert perfil["job_level"] == 3
+
+
+def test_colunas_ausentes_levantam_erro(tmp_path):
+    linha = _linha_valida()
+    del linha["job_role"]
+    path = _grava_catalogo(tmp_path / "cenarios.csv", [linha])
+
+    with pytest.raises(ValueError, match="job_role"):
+        scenario_catalog.read_catalog(path)
+
+
+def test_catalogo_do_repositorio_e_valido():
+    catalogo, problemas = scenario_catalog.read_catalog(CATALOGO_REAL)
+
+    assert problemas == []
+    assert len(catalogo) > 0